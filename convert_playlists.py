@@ -37,48 +37,113 @@ Used both locally and by GitHub Actions (convert-playlists.yml, process-submissi
     JSON  — NDJSON:          {"name":"...","url":"...","ovol":"0"}  (one object per line)
 """
 
+import functools
+import mmap
 import os
 import re
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Tuple, Optional, List, Dict
 
+try:
+    import ijson  # optional: streams large JSON arrays without loading them whole
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: C JSON parser, several times faster than stdlib
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: str):
+    """Parse a JSON document with orjson when available, stdlib json otherwise"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Files up to this size are read in one go in parse_file; larger ones stream
+_READ_WHOLE_LIMIT = 32 * 1024 * 1024
+
+# JSON arrays above this size stream through ijson instead of one json.loads
+_STREAM_JSON_LIMIT = 1024 * 1024
+
+# Pre-compiled patterns for the per-line parsing hot paths
+_BARE_URL_RE = re.compile(r'^[a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,}[/:#]')
+# url_to_name transforms: ':' + digit skips to the next '/' (port strip),
+# a delimiter run after a literal '-' vanishes, any other run becomes '-'
+_PORT_SKIP_RE = re.compile(r':\d[^/]*')
+_DELIM_AFTER_DASH_RE = re.compile(r'(?<=-)[/=&?]+')
+_DELIM_RUN_RE = re.compile(r'[/=&?]+')
+# Characters that force a string through the general JSON encoder
+_JSON_ESCAPE_RE = re.compile(r'[\x00-\x1f"\\]')
+
+
+def _decode(data: bytes) -> str:
+    """Decode playlist bytes: one cheap ASCII attempt (the common case for
+    URL-heavy files), then UTF-8 with undecodable bytes dropped, matching the
+    old text-mode errors='ignore' behavior"""
+    try:
+        return data.decode('ascii')
+    except UnicodeDecodeError:
+        return data.decode('utf-8', 'ignore')
+
+
+def _iter_mmap_lines(fileobj):
+    """Yield decoded lines from an open file via mmap — the kernel pages the
+    data on demand, so large playlists are never copied into memory whole"""
+    with mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = 0
+        size = len(mm)
+        while pos < size:
+            nl = mm.find(b'\n', pos)
+            if nl == -1:
+                nl = size
+            yield mm[pos:nl].decode('utf-8', 'ignore')
+            pos = nl + 1
+
+
+def _json_str(s: str) -> str:
+    """Encode a string as a JSON value. Station names and URLs almost never
+    contain characters needing escapes, so quote them directly and only fall
+    back to json.dumps when they do (identical output either way)."""
+    if _JSON_ESCAPE_RE.search(s) is None:
+        return '"' + s + '"'
+    return json.dumps(s, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=8192)
+def _url_to_name(url: str, max_len: int = 128) -> str:
+    """Derive a station name from a URL (memoized: the same stream URL often
+    appears across playlists and this only depends on its arguments)."""
+    # Scheme strip with a one-character dispatch: url[4] is ':' for http://
+    # and 's' for https://, so at most one prefix comparison ever runs
+    s = url
+    c = url[4:5]
+    if c == ':':
+        if s.startswith('http://'):
+            s = s[7:]
+    elif c == 's' and s.startswith('https://'):
+        s = s[8:]
+    s = _PORT_SKIP_RE.sub('', s)
+    s = s.lstrip('/=&?')
+    s = _DELIM_AFTER_DASH_RE.sub('', s)
+    s = _DELIM_RUN_RE.sub('-', s)
+    return s[:max_len - 1].rstrip('-')
+
 
 class PlaylistConverter:
     def __init__(self, input_dir: str = "playlists", output_dir: str = "playlists-output"):
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Cached string prefix so per-file output paths are plain concatenation
+        self.output_dir_str = str(self.output_dir) + os.sep
         
     def url_to_name(self, url: str, max_len: int = 128) -> str:
-        start = url
-        if start.startswith('http://'):
-            start = start[7:]
-        elif start.startswith('https://'):
-            start = start[8:]
-        name_chars = []
-        i = 0
-        j = 0
-        while i < len(start) and j < max_len - 1:
-            c = start[i]
-            if c == ':' and i+1 < len(start) and start[i+1].isdigit():
-                while i < len(start) and start[i] != '/':
-                    i += 1
-                if i >= len(start):
-                    break
-                c = start[i]
-            if c in ['/', '=', '&', '?']:
-                if j > 0 and name_chars[j-1] != '-':
-                    name_chars.append('-')
-                    j += 1
-            else:
-                name_chars.append(c)
-                j += 1
-            i += 1
-        while name_chars and name_chars[-1] == '-':
-            name_chars.pop()
-        return ''.join(name_chars)
+        return _url_to_name(url, max_len)
 
     def _parse_tab_delimited(self, line: str) -> Optional[Tuple[str, str, int]]:
         """Parse tab-delimited line (C++ logic)"""
@@ -124,31 +189,25 @@ class PlaylistConverter:
             name = tokens[name_idx]
             return (name, url, 0)
         elif t >= 3:
-            # Find URL (must contain . and / or ://)
+            # Single pass: each token is claimed as the URL (must contain
+            # . and / or ://), the ovol (first valid int -64 to 64), or the
+            # name (first remaining field), in that order of precedence
             url_idx = -1
-            for i, token in enumerate(tokens):
-                if self._is_url(token):
-                    url_idx = i
-                    break
-            if url_idx == -1:
-                return None
-            # Find ovol (first valid int -64 to 64)
-            ovol = 0
             ovol_idx = -1
+            ovol = 0
+            name = ''
             for i, token in enumerate(tokens):
-                if i == url_idx:
-                    continue
-                if self._is_ovol(token):
+                if url_idx == -1 and self._is_url(token):
+                    url_idx = i
+                elif ovol_idx == -1 and self._is_ovol(token):
                     ovol_idx = i
                     ovol = self._parse_ovol(token)
-                    break
-            # Find name: first field that's not URL and not ovol
-            name = ''
-            for i, token in enumerate(tokens):
-                if i == url_idx or i == ovol_idx:
-                    continue
-                if not name:
+                elif not name:
                     name = token
+                elif url_idx != -1 and ovol_idx != -1:
+                    break  # all three fields claimed
+            if url_idx == -1:
+                return None
             url = self._normalize_url(tokens[url_idx])
             if not name:
                 name = self.url_to_name(url)
@@ -216,8 +275,9 @@ class PlaylistConverter:
 
     def _parse_two_space_delimited(self, line: str) -> Optional[Tuple[str, str, int]]:
         """Parse two-space-delimited line (2+ spaces as delimiter)"""
-        # Split on 2 or more consecutive spaces
-        tokens = [t.strip() for t in re.split(r'  +', line) if t.strip()]
+        # Split on 2 or more consecutive spaces: str.split('  ') breaks on every
+        # two-space boundary and longer runs just produce empties we filter out
+        tokens = [t for t in (p.strip() for p in line.split('  ')) if t]
         t = len(tokens)
         if t == 1:
             if self._is_url(tokens[0]):
@@ -259,31 +319,25 @@ class PlaylistConverter:
             name = tokens[name_idx]
             return (name, url, 0)
         elif t >= 3:
-            # Find URL (must contain . and / or ://)
+            # Single pass: each token is claimed as the URL (must contain
+            # . and / or ://), the ovol (first valid int -64 to 64), or the
+            # name (first remaining field), in that order of precedence
             url_idx = -1
-            for i, token in enumerate(tokens):
-                if self._is_url(token):
-                    url_idx = i
-                    break
-            if url_idx == -1:
-                return None
-            # Find ovol (first valid int -64 to 64)
-            ovol = 0
             ovol_idx = -1
+            ovol = 0
+            name = ''
             for i, token in enumerate(tokens):
-                if i == url_idx:
-                    continue
-                if self._is_ovol(token):
+                if url_idx == -1 and self._is_url(token):
+                    url_idx = i
+                elif ovol_idx == -1 and self._is_ovol(token):
                     ovol_idx = i
                     ovol = self._parse_ovol(token)
-                    break
-            # Find name: first field that's not URL and not ovol
-            name = ''
-            for i, token in enumerate(tokens):
-                if i == url_idx or i == ovol_idx:
-                    continue
-                if not name:
+                elif not name:
                     name = token
+                elif url_idx != -1 and ovol_idx != -1:
+                    break  # all three fields claimed
+            if url_idx == -1:
+                return None
             url = self._normalize_url(tokens[url_idx])
             if not name:
                 name = self.url_to_name(url)
@@ -292,10 +346,16 @@ class PlaylistConverter:
 
     def _is_url(self, token: str) -> bool:
         """Check if token looks like a URL (must start with protocol or bare domain)"""
-        if token.startswith('http://') or token.startswith('https://'):
+        # Only tokens starting 'h' can carry a scheme prefix, so one character
+        # read skips the prefix comparison for everything else
+        if token[:1] == 'h' and token.startswith(('http://', 'https://')):
             return True
-        # Bare URL: must start with alphanumeric domain pattern like example.com/path
-        return bool(re.match(r'^[a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,}[/:#]', token))
+        # Bare URL: must start with alphanumeric domain pattern like example.com/path.
+        # The pattern needs a dot, so a cheap find() rejects plain names before
+        # the regex engine is ever entered.
+        if '.' not in token:
+            return False
+        return bool(_BARE_URL_RE.match(token))
     
     def _extract_url_from_token(self, token: str) -> Optional[Tuple[str, str]]:
         """If a token contains an embedded http(s):// URL, extract (name_prefix, url) from it."""
@@ -309,26 +369,30 @@ class PlaylistConverter:
     
     def _is_ovol(self, token: str) -> bool:
         """Check if token is a valid ovol value"""
-        try:
-            val = int(token)
-            return -64 <= val <= 64
-        except ValueError:
+        # Pre-screen with a C-level digit check: most tokens are station names,
+        # and raising/catching ValueError from int() costs far more than isdecimal()
+        s = token[1:] if token[:1] in '+-' else token
+        if not s or not s.isdecimal():
             return False
-    
+        val = int(token)
+        return -64 <= val <= 64
+
     def _parse_ovol(self, token: str) -> int:
         """Parse and clamp ovol value"""
-        try:
-            val = int(token)
-            return max(-30, min(30, val))
-        except ValueError:
+        s = token[1:] if token[:1] in '+-' else token
+        if not s or not s.isdecimal():
             return 0
+        val = int(token)
+        return max(-30, min(30, val))
     
     def _normalize_url(self, url: str) -> str:
         """Ensure URL has http:// or https:// prefix"""
-        url = url.strip()
-        if not url.startswith('http://') and not url.startswith('https://'):
-            return f'http://{url}'
-        return url
+        # Skip the strip() copy for already-clean tokens (the common case)
+        if url[:1].isspace() or url[-1:].isspace():
+            url = url.strip()
+        if url.startswith(('http://', 'https://')):
+            return url
+        return 'http://' + url
     
     def parse_json_line(self, line: str) -> Optional[Tuple[str, str, int]]:
         """Parse a JSON line (Ka-Radio format with URL/File/Port or standard format)"""
@@ -341,21 +405,23 @@ class PlaylistConverter:
             obj = json.loads(line)
         except json.JSONDecodeError:
             return None
+        return self._parse_json_obj(obj)
+
+    def _parse_json_obj(self, obj: Dict) -> Optional[Tuple[str, str, int]]:
+        """Build a (name, url, ovol) entry from an already-decoded JSON object"""
+        if not isinstance(obj, dict):
+            return None
+        # Bind the lookup once; each candidate key then costs one hash probe
+        get = obj.get
         # Extract name (optional)
-        name = obj.get('name') or obj.get('Name') or obj.get('title') or ''
-        url = ''
-        gotUrl = False
+        name = get('name') or get('Name') or get('title') or ''
         # Priority: url_resolved > url > host+file+port
-        if 'url_resolved' in obj and obj['url_resolved']:
-            url = obj['url_resolved']
-            gotUrl = True
-        elif 'url' in obj and obj['url']:
-            url = obj['url']
-            gotUrl = True
-        else:
-            host = obj.get('host') or obj.get('URL') or ''
-            file = obj.get('file') or obj.get('File') or ''
-            portStr = obj.get('port') or obj.get('Port') or '80'
+        url = get('url_resolved') or get('url') or ''
+        gotUrl = bool(url)
+        if not gotUrl:
+            host = get('host') or get('URL') or ''
+            file = get('file') or get('File') or ''
+            portStr = get('port') or get('Port') or '80'
             try:
                 port = int(str(portStr))
             except Exception:
@@ -379,7 +445,7 @@ class PlaylistConverter:
         if not gotUrl or not url.strip():
             return None
         url = self._normalize_url(url)
-        ovolbuf = obj.get('ovol') or obj.get('Ovol') or '0'
+        ovolbuf = get('ovol') or get('Ovol') or '0'
         try:
             ovol = int(str(ovolbuf).strip('"'))
             ovol = max(-30, min(30, ovol))
@@ -390,42 +456,52 @@ class PlaylistConverter:
             name = self.url_to_name(url)
         return (name, url, ovol)
     
-    def write_csv_output(self, entries: List[Tuple[str, str, int]], output_path: Path) -> None:
+    def write_csv_output(self, names: List[str], urls: List[str], ovols: List[int],
+                         output_path: str) -> None:
         """Write entries to CSV format (tab-delimited)"""
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            for name, url, ovol in entries:
-                f.write(f'{name}\t{url}\t{ovol}\n')
-    
-    def write_json_output(self, entries: List[Tuple[str, str, int]], output_path: Path) -> None:
+        buf = ''.join(f'{name}\t{url}\t{ovol}\n'
+                      for name, url, ovol in zip(names, urls, ovols))
+        # Encode once and write bytes: skips the TextIOWrapper entirely
+        with open(output_path, 'wb') as f:
+            f.write(buf.encode('utf-8'))
+
+    def write_json_output(self, names: List[str], urls: List[str], ovols: List[int],
+                          output_path: str) -> None:
         """Write entries to JSONL/NDJSON format (one object per line, no brackets, no commas)"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for name, url, ovol in entries:
-                obj = {'name': name, 'url': url, 'ovol': str(ovol)}
-                f.write(json.dumps(obj, separators=(',', ':'), ensure_ascii=False) + '\n')
+        buf = ''.join(
+            f'{{"name":{_json_str(name)},"url":{_json_str(url)},"ovol":"{ovol}"}}\n'
+            for name, url, ovol in zip(names, urls, ovols)
+        )
+        with open(output_path, 'wb') as f:
+            f.write(buf.encode('utf-8'))
     
-    def convert_file(self, input_path: Path) -> bool:
-        """Convert a file to both CSV and JSON formats"""
-        print(f"Processing: {input_path.name}")
-        
+    def convert_file(self, input_path: Path, log: Optional[List[str]] = None) -> bool:
+        """Convert a file to both CSV and JSON formats.
+
+        When a log list is given, progress messages are appended to it instead
+        of printed, so pool workers can hand them back for ordered output."""
+        emit = print if log is None else log.append
+        emit(f"Processing: {input_path.name}")
+
         # Parse the input file
-        entries = self.parse_file(input_path)
-        
-        if not entries:
-            print(f"  [!] No valid entries found in {input_path.name}")
+        names, urls, ovols = self.parse_file(input_path)
+
+        if not names:
+            emit(f"  [!] No valid entries found in {input_path.name}")
             return False
-        
+
         # Generate base name (without extension)
         base_name = input_path.stem
-        
+
         # Write both CSV and JSON outputs
-        csv_path = self.output_dir / f"{base_name}.csv"
-        json_path = self.output_dir / f"{base_name}.json"
-        
-        self.write_csv_output(entries, csv_path)
-        self.write_json_output(entries, json_path)
-        
-        print(f"  [OK] Wrote {len(entries)} entries to {csv_path.name}")
-        print(f"  [OK] Wrote {len(entries)} entries to {json_path.name}")
+        csv_name = base_name + '.csv'
+        json_name = base_name + '.json'
+
+        self.write_csv_output(names, urls, ovols, self.output_dir_str + csv_name)
+        self.write_json_output(names, urls, ovols, self.output_dir_str + json_name)
+
+        emit(f"  [OK] Wrote {len(names)} entries to {csv_name}")
+        emit(f"  [OK] Wrote {len(names)} entries to {json_name}")
         return True
     
     def convert_all(self) -> int:
@@ -435,58 +511,137 @@ class PlaylistConverter:
             return 0
         
         file_count = 0
-        
-        # Process all CSV and JSON files
-        for file_path in sorted(self.input_dir.glob('*')):
-            if file_path.is_file() and file_path.suffix.lower() in ['.csv', '.json']:
-                if self.convert_file(file_path):
-                    file_count += 1
-        
+
+        # Process all CSV and JSON files; scandir caches the file type from
+        # readdir, so filtering costs no extra stat per entry
+        with os.scandir(self.input_dir) as it:
+            candidates = [e for e in it
+                          if e.is_file(follow_symlinks=False)
+                          and e.name.lower().endswith(('.csv', '.json'))]
+        candidates.sort(key=lambda e: e.name)
+        paths = [Path(e.path) for e in candidates]
+
+        # Each file converts independently, so fan out across processes;
+        # for a handful of files the pool spawn cost outweighs the win,
+        # so convert those serially
+        if len(paths) < 4:
+            file_count = sum(1 for path in paths if self.convert_file(path))
+        else:
+            convert = functools.partial(_convert_one,
+                                        input_dir=str(self.input_dir),
+                                        output_dir=str(self.output_dir))
+            file_count = 0
+            with ProcessPoolExecutor() as ex:
+                # One buffered log per file, flushed here in input order
+                for converted, log_text in ex.map(convert, paths):
+                    sys.stdout.write(log_text)
+                    file_count += converted
+
         return file_count
 
 
-    def parse_file(self, input_path: Path) -> List[Tuple[str, str, int]]:
-        """Parse input file (CSV or JSON/JSONL) and return list of (name, url, ovol) tuples"""
-        entries: List[Tuple[str, str, int]] = []
-        with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
+    def parse_file(self, input_path: Path) -> Tuple[List[str], List[str], List[int]]:
+        """Parse input file (CSV or JSON/JSONL) and return parallel
+        (names, urls, ovols) lists — one column per field"""
+        names: List[str] = []
+        urls: List[str] = []
+        ovols: List[int] = []
+        # Bind hot lookups to locals once: LOAD_FAST in the per-line/per-object
+        # loops instead of repeated attribute resolution
+        add_name = names.append
+        add_url = urls.append
+        add_ovol = ovols.append
+        parse_obj = self._parse_json_obj
+        with open(input_path, 'rb') as f:
             first_line = f.readline()
             f.seek(0)
-            # JSON detection
-            if input_path.suffix.lower() == '.json' or first_line.strip().startswith('{') or first_line.strip().startswith('['):
-                is_jsonl = not first_line.strip().startswith('[')
+            # JSON detection: strip once and dispatch on the first byte
+            first_char = first_line.strip()[:1]
+            if input_path.suffix.lower() == '.json' or first_char == b'{' or first_char == b'[':
+                is_jsonl = first_char != b'['
                 if is_jsonl:
-                    for line in f:
-                        result = self.parse_json_line(line)
-                        if result:
-                            entries.append(result)
+                    # Try one whole-document parse first: a single C-level
+                    # pass handles pretty-printed objects the line loop
+                    # cannot, and true JSONL simply falls through to it
+                    text = _decode(f.read())
+                    try:
+                        doc = _json_loads(text)
+                    except Exception:
+                        doc = None
+                    if isinstance(doc, dict):
+                        doc = [doc]
+                    if isinstance(doc, list):
+                        for obj in doc:
+                            result = parse_obj(obj)
+                            if result:
+                                add_name(result[0])
+                                add_url(result[1])
+                                add_ovol(result[2])
+                    else:
+                        parse_line = self.parse_json_line
+                        for line in text.splitlines():
+                            result = parse_line(line)
+                            if result:
+                                add_name(result[0])
+                                add_url(result[1])
+                                add_ovol(result[2])
                 else:
-                    # If wrapped in brackets, treat as array
-                    content = f.read()
+                    # If wrapped in brackets, treat as array. Small files
+                    # parse fastest in one _json_loads call; large ones
+                    # stream through ijson (when available) so the whole
+                    # document never sits in memory at once
                     try:
-                        arr = json.loads(content)
-                        for obj in arr:
-                            line = json.dumps(obj)
-                            result = self.parse_json_line(line)
+                        if ijson is not None and os.fstat(f.fileno()).st_size > _STREAM_JSON_LIMIT:
+                            items = ijson.items(f, 'item')
+                        else:
+                            data = f.read()
+                            try:
+                                items = _json_loads(data)
+                            except Exception:
+                                # e.g. stray bytes the old text-mode
+                                # errors='ignore' read tolerated
+                                items = json.loads(_decode(data))
+                        for obj in items:
+                            result = parse_obj(obj)
                             if result:
-                                entries.append(result)
+                                add_name(result[0])
+                                add_url(result[1])
+                                add_ovol(result[2])
                     except Exception:
                         pass
             else:
-                # CSV/TSV detection: for each line, use tab-delimited if tab present, 
-                # two-space-delimited if 2+ spaces present, else space-delimited
-                for line in f:
+                # CSV/TSV detection: for each line, use tab-delimited if tab present,
+                # two-space-delimited if 2+ spaces present, else space-delimited.
+                # Read the whole file in one go (amortizes I/O and per-line
+                # readline overhead); stream only for unusually large files.
+                if os.fstat(f.fileno()).st_size <= _READ_WHOLE_LIMIT:
+                    lines = _decode(f.read()).splitlines()
+                else:
+                    lines = _iter_mmap_lines(f)
+                for line in lines:
                     line = line.strip()
                     if not line:
                         continue
                     if '\t' in line:
                         result = self._parse_tab_delimited(line)
-                    elif re.search(r'  +', line):  # 2 or more consecutive spaces
+                    elif '  ' in line:  # 2 or more consecutive spaces
                         result = self._parse_two_space_delimited(line)
                     else:
                         result = self._parse_space_delimited(line)
                     if result:
-                        entries.append(result)
-        return entries
+                        names.append(result[0])
+                        urls.append(result[1])
+                        ovols.append(result[2])
+        return names, urls, ovols
+
+
+def _convert_one(path: Path, input_dir: str, output_dir: str) -> Tuple[int, str]:
+    """Convert a single file in a worker process (top-level so it pickles).
+    Returns (1 if converted else 0, buffered progress text)."""
+    converter = PlaylistConverter(input_dir, output_dir)
+    log: List[str] = []
+    converted = 1 if converter.convert_file(path, log) else 0
+    return converted, '\n'.join(log) + '\n'
 
 
 def validate_file(filepath: str) -> int:
@@ -496,8 +651,8 @@ def validate_file(filepath: str) -> int:
     if not path.exists():
         print(f"ERROR: File not found: {filepath}")
         return 1
-    entries = converter.parse_file(path)
-    count = len(entries)
+    names, _, _ = converter.parse_file(path)
+    count = len(names)
     if count == 0:
         print(f"ERROR: No valid entries found in '{path.name}'.")
         print(f"See README.md for accepted playlist formats.")
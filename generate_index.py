@@ -5,6 +5,7 @@ Output format: [{"name":"...", "csv":"...", "json":"...", "total":"N"}]
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 from collections import defaultdict
@@ -18,19 +19,23 @@ def generate_index(playlists_dir: str = "playlists-output", output_file: str = "
         print(f"Error: Directory '{playlists_dir}' not found")
         return False
     
-    # Group files by base name (without extension)
+    # Group files by base name (without extension); scandir avoids the extra
+    # stat per entry that glob + is_file() costs
     file_groups = defaultdict(dict)
-    
-    for file_path in sorted(playlists_path.glob('*')):
-        if file_path.is_file() and file_path.suffix.lower() in ['.csv', '.json']:
-            base_name = file_path.stem
-            ext = file_path.suffix.lower()[1:]  # Remove the dot
-            
-            file_groups[base_name][ext] = file_path.name
+
+    with os.scandir(playlists_path) as it:
+        file_names = sorted(e.name for e in it
+                            if e.is_file(follow_symlinks=False)
+                            and e.name.lower().endswith(('.csv', '.json')))
+
+    for file_name in file_names:
+        base_name, ext = os.path.splitext(file_name)
+        file_groups[base_name][ext.lower()[1:]] = file_name
     
     # Build index entries
     index_entries = []
-    
+    dir_prefix = playlists_dir + os.sep
+
     for base_name in sorted(file_groups.keys()):
         files = file_groups[base_name]
         
@@ -41,13 +46,21 @@ def generate_index(playlists_dir: str = "playlists-output", output_file: str = "
         # Generate display name from filename
         display_name = base_name.replace('_', ' ')
         
-        # Count lines in CSV file
-        csv_path = playlists_path / files['csv']
+        # Count lines in CSV file by counting newlines over the raw bytes —
+        # the converter writes exactly one '\n'-terminated entry per line,
+        # so no decoding or per-line filtering is needed
+        csv_path = dir_prefix + files['csv']
         try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                total = sum(1 for line in f if line.strip())
+            total = 0
+            tail = b''
+            with open(csv_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    total += chunk.count(b'\n')
+                    tail = chunk
+            if tail and not tail.endswith(b'\n'):
+                total += 1  # unterminated final line
         except Exception as e:
-            print(f"Warning: Could not read {csv_path.name}: {e}")
+            print(f"Warning: Could not read {files['csv']}: {e}")
             total = 0
         
         # Create entry
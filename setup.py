@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Optional accelerator build — compiles convert_playlists.py to a C extension.
+
+The converter is pure string manipulation in tight per-line loops, which
+Cython speeds up considerably. This build is entirely optional: the plain
+convert_playlists.py remains the canonical implementation and is what the
+GitHub Actions workflows run. If a compiled convert_playlists extension is
+present next to the .py, Python will import it instead automatically.
+
+## Usage
+    pip install cython setuptools
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("Cython is required for the optional accelerator build: "
+                     "pip install cython")
+
+setup(
+    name='webstations-converter',
+    ext_modules=cythonize('convert_playlists.py', language_level=3),
+)